@@ -1,13 +1,6 @@
 """Scientific colormaps for python, without dependencies."""
 
-from importlib.metadata import PackageNotFoundError, version
-from typing import TYPE_CHECKING, Iterator, Mapping
-
-try:
-    __version__ = version("cmap")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "uninstalled"
-
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 
 from ._color import HSLA, HSVA, RGBA, RGBA8, Color
 from ._colormap import Colormap, ColorStops
@@ -61,6 +54,22 @@ if TYPE_CHECKING:
 else:
     from ._catalog import Catalog, CatalogItem
 
+
+def __getattr__(name: str) -> Any:
+    # __version__ is looked up lazily: importlib.metadata is slow to import, and
+    # is otherwise not needed by `import cmap`
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            __version__ = version("cmap")
+        except PackageNotFoundError:  # pragma: no cover
+            __version__ = "uninstalled"
+        globals()["__version__"] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Catalog",
     "CatalogItem",
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import colorsys
-import contextlib
 import re
 import sys
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,9 +13,9 @@ from typing import (
     NamedTuple,
     Sequence,
     SupportsFloat,
-    cast,
     overload,
 )
+from weakref import WeakValueDictionary
 
 import numpy as np
 
@@ -102,8 +102,9 @@ class RGBA(NamedTuple):
     def to_8bit(self) -> RGBA8:
         """Convert to 8-bit integer form."""
         # not performing min/max checks here
-        r, g, b = (round(x * 255) for x in (self.r, self.g, self.b))
-        return RGBA8(r, g, b, self.a)
+        return RGBA8(
+            round(self.r * 255), round(self.g * 255), round(self.b * 255), self.a
+        )
 
     def to_hex(self) -> str:
         """Convert to hex color."""
@@ -111,17 +112,55 @@ class RGBA(NamedTuple):
 
     def to_hsv(self) -> HSVA:
         """Convert to Hue, Saturation, Value."""
-        return HSVA(*colorsys.rgb_to_hsv(self.r, self.g, self.b), self.a)
+        # equivalent to colorsys.rgb_to_hsv, inlined to avoid the extra call overhead
+        r, g, b, a = self
+        maxc = max(r, g, b)
+        minc = min(r, g, b)
+        rangec = maxc - minc
+        if rangec == 0:
+            return HSVA(0.0, 0.0, maxc, a)
+        return HSVA(_hue(r, g, b, maxc, rangec), rangec / maxc, maxc, a)
 
     def to_hsl(self) -> HSLA:
         """Convert to Hue, Saturation, Lightness."""
-        h, ll, s = colorsys.rgb_to_hls(self.r, self.g, self.b)
-        return HSLA(h, s, ll, self.a)
+        # equivalent to colorsys.rgb_to_hls, inlined to avoid the extra call overhead
+        r, g, b, a = self
+        maxc = max(r, g, b)
+        minc = min(r, g, b)
+        rangec = maxc - minc
+        lightness = (maxc + minc) / 2
+        if rangec == 0:
+            return HSLA(0.0, 0.0, lightness, a)
+        if lightness <= 0.5:
+            s = rangec / (maxc + minc)
+        else:
+            s = rangec / (2.0 - maxc - minc)
+        return HSLA(_hue(r, g, b, maxc, rangec), s, lightness, a)
 
     def __str__(self) -> str:
         return self.to_hex()
 
 
+# lookup table of two-digit (uppercase) hex strings for all 8-bit values
+_HEX = tuple(f"{i:02X}" for i in range(256))
+# lookup table of 8-bit values converted to floats in the range 0-1
+_U8_TO_FLOAT = tuple(i / 255 for i in range(256))
+# cache of RGBA8.to_hex() results (bounded, so that it can't grow without limit)
+_HEX_CACHE: dict[RGBA8, str] = {}
+_HEX_CACHE_SIZE = 4096
+
+
+def _hue(r: float, g: float, b: float, maxc: float, rangec: float) -> float:
+    """Return the hue (0-1) of an RGB color, given its max and (max - min) values."""
+    if r == maxc:
+        h = (g - b) / rangec
+    elif g == maxc:
+        h = 2.0 + (b - r) / rangec
+    else:
+        h = 4.0 + (r - g) / rangec
+    return (h / 6.0) % 1.0
+
+
 class RGBA8(NamedTuple):
     """8 bit RGBA color tuple, where RGB values are from 0 to 255, alpha from 0 to 1."""
 
@@ -136,12 +175,24 @@ class RGBA8(NamedTuple):
 
     def to_float(self) -> RGBA:
         """Convert to float."""
-        return RGBA(self.r / 255, self.g / 255, self.b / 255, self.a)
+        return RGBA(
+            _U8_TO_FLOAT[self.r], _U8_TO_FLOAT[self.g], _U8_TO_FLOAT[self.b], self.a
+        )
 
     def to_hex(self) -> str:
         """Convert to hex color."""
-        out = f"#{self.r:02X}{self.g:02X}{self.b:02X}"
-        return f"{out}{round(self.a*255):02X}" if self.a != 1 else out
+        if (cached := _HEX_CACHE.get(self)) is not None:
+            return cached
+        r, g, b, a = self
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            # RGBA8 does not validate its values: clamp them for the table lookup
+            r, g, b = _bound_0_255((r, g, b))
+        out = "#" + _HEX[r] + _HEX[g] + _HEX[b]
+        if a != 1:
+            out += _HEX[round(_bound_0_1(a) * 255)]
+        if len(_HEX_CACHE) < _HEX_CACHE_SIZE:
+            _HEX_CACHE[self] = out
+        return out
 
     def to_hsv(self) -> HSVA:
         """Convert to Hue, Saturation, Value."""
@@ -161,16 +212,21 @@ class RGBA8(NamedTuple):
         return f"rgba({self.r}, {self.g}, {self.b}, {self.a})"
 
 
-# regexes for parsing color strings
-_num = r"(-?\d+\.?\d*|none)"  # a number or the string 'none'
-_perc = r"(-?\d+\.?\d*%|none)"  # a percentage or the string 'none'
-_nump = r"(-?\d+\.?\d*%?|none)"  # a number or percentage or the string 'none'
-# parse an rgb(a) string
-reRGB = re.compile(rf"rgba?\(\s*{_nump}[,\s]+{_nump}[,\s]+{_nump}[,\s/]*{_nump}?\)")
+# regexes for parsing color strings.
+# Channel groups are None for the string 'none' (which is not captured).
+_num = r"(?:(-?\d+\.?\d*)|none)"  # a number
+_perc = r"(?:(-?\d+\.?\d*)%|none)"  # a percentage (the '%' is not captured)
+_nump = r"(-?\d+\.?\d*%?|none)"  # an alpha number or percentage, or the string 'none'
+# a number and an optional '%' in separate groups
+_chan = r"(?:(-?\d+\.?\d*)(%)?|none)"
+# parse an rgb(a) string (anchored, so trailing garbage fails fast)
+reRGB = re.compile(rf"rgba?\(\s*{_chan}[,\s]+{_chan}[,\s]+{_chan}[,\s/]*{_nump}?\)\s*$")
 # parse an hsl(a) string
-reHSL = re.compile(rf"hsla?\(\s*{_num}[,\s]+{_perc}[,\s]+{_perc}[,\s/]*{_nump}?\)")
-# used to strip delimiter characters from color strings with `delim.sub("", name)`
-delim = re.compile(r"( |-|_)", re.I)
+reHSL = re.compile(rf"hsla?\(\s*{_num}[,\s]+{_perc}[,\s]+{_perc}[,\s/]*{_nump}?\)\s*$")
+# parse a #RGB, #RRGGBB, or #RRGGBBAA hex string (the '#' may also be '0x' or absent)
+reHEX = re.compile(r"#*(?:0x)?([0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3})")
+# used to strip delimiter characters from color names with `name.translate(...)`
+_DELIM_TABLE = str.maketrans("", "", " -_")
 
 
 def _parse_rgb_string(rgb: str) -> RGBA8 | None:
@@ -209,21 +265,32 @@ def _parse_rgb_string(rgb: str) -> RGBA8 | None:
     m = reRGB.match(rgb)
     if not m:
         return None
-    out = []
-    for n, val in enumerate(m.groups()):
-        if val is None and n == 3:  # no alpha
-            break
-        if val in (None, "none"):
-            val = 0
-        elif val.endswith("%"):
-            val = float(val[:-1]) / 100
-            if n < 3:
-                val = round(val * 255)
-        else:
-            val = float(val)
-            val = round(val) if n < 3 else min(1, max(0, val))
-        out.append(min(255, max(0, val)))
-    return RGBA8(*out)  # type: ignore
+    r, r_pct, g, g_pct, b, b_pct, a = m.groups()
+    return RGBA8(
+        _parse_rgb_channel(r, r_pct),
+        _parse_rgb_channel(g, g_pct),
+        _parse_rgb_channel(b, b_pct),
+        1 if a is None else _parse_alpha(a),  # None means no alpha was provided
+    )
+
+
+def _parse_rgb_channel(num: str | None, pct: str | None) -> int:
+    """Convert a matched rgb() channel to an integer between 0 and 255.
+
+    `num` is the matched number (None for 'none'), and `pct` is '%' or None.
+    """
+    if num is None:
+        return 0
+    n = round(float(num) / 100 * 255) if pct else round(float(num))
+    return 0 if n < 0 else 255 if n > 255 else n
+
+
+def _parse_alpha(val: str) -> float:
+    """Convert a matched alpha string (number or percentage) to a float from 0-1."""
+    if val == "none":
+        return 0
+    a = float(val[:-1]) / 100 if val.endswith("%") else float(val)
+    return 0 if a < 0 else 1 if a > 1 else a
 
 
 def _parse_hsl_string(hsl: str) -> HSLA | None:
@@ -240,37 +307,35 @@ def _parse_hsl_string(hsl: str) -> HSLA | None:
         An HSLA named tuple, all values are floats between 0 and 1.
     """
     m = reHSL.match(hsl)
-    if not m:  # pragma: no cover
+    if not m:
         return None
-    out = []
-    for n, val in enumerate(m.groups()):
-        if val is None and n == 3:  # no alpha
-            break
-        if val in (None, "none"):
-            val = 0
-        elif val.endswith("%"):
-            val = float(val[:-1]) / 100
-        else:
-            val = float(val)
-            # the hue is a circle expressed in degrees,
-            # the other values are percentages
-            val = val % 360 / 360 if n == 0 else min(1, max(0, val))
-        out.append(val)
-    return HSLA(*out)
+    h, sat, light, a = m.groups()
+    return HSLA(
+        # the hue is a circle expressed in degrees, the others are percentages
+        0 if h is None else float(h) % 360 / 360,
+        0 if sat is None else _bound_0_1(float(sat) / 100),
+        0 if light is None else _bound_0_1(float(light) / 100),
+        1 if a is None else _parse_alpha(a),  # None means no alpha was provided
+    )
 
 
 def _parse_hex_string(hex: str) -> RGBA8:
     """Convert hex color to RGB."""
-    _hex = hex.lstrip("#")
-    if _hex.startswith("0x"):
-        _hex = _hex[2:]
-    if len(_hex) == 3:
-        _hex = "".join(2 * s for s in _hex)
-    if len(_hex) not in (6, 8):
+    m = reHEX.fullmatch(hex)
+    if not m:
         raise ValueError(f"Input #{hex} is not in #RRGGBB or #RGB format")
-    r, g, b, *_a = (int(_hex[i : i + 2], 16) for i in range(0, len(_hex), 2))
-    a = max(0, min(1, _a[0] / 255)) if _a else 1
-    return RGBA8(r, g, b, a)
+    _hex = m.group(1)
+    # parse the whole string at once, then pull out the channels with bit shifts
+    n = int(_hex, 16)
+    if len(_hex) == 3:
+        # each digit is doubled (#ABC -> #AABBCC), i.e. multiplied by 0x11
+        return RGBA8((n >> 8) * 0x11, ((n >> 4) & 0xF) * 0x11, (n & 0xF) * 0x11)
+    if len(_hex) == 8:
+        a: float = (n & 0xFF) / 255
+        n >>= 8
+    else:
+        a = 1
+    return RGBA8((n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF, a)
 
 
 # fmt: off
@@ -281,17 +346,24 @@ def _bound_0_1(values: Sequence[SupportsFloat]) -> Sequence[float]: ...
 def _bound_0_1(
     values: SupportsFloat | Sequence[SupportsFloat],
 ) -> float | Sequence[SupportsFloat]:
-    # round here?
-    return np.clip(values, 0, 1).astype(float)  # type: ignore
+    # for a handful of values, plain python is much faster than a numpy roundtrip
+    if isinstance(values, Sequence):
+        return [0.0 if v < 0 else 1.0 if v > 1 else v for v in map(float, values)]
+    v = float(values)
+    return 0.0 if v < 0 else 1.0 if v > 1 else v
 # fmt: on
 
 
-def _bound_0_255(values: Iterable[SupportsFloat]) -> Iterable[int]:
-    return (max(0, min(255, round(float(v)))) for v in values)
+def _bound_0_255(values: Iterable[SupportsFloat]) -> list[int]:
+    return [
+        0 if v < 0 else 255 if v > 255 else v for v in map(round, map(float, values))
+    ]
 
 
 def _norm_name(name: str) -> str:
-    return delim.sub("", name).lower()
+    if name in NAME_TO_RGB:  # already normalized (e.g. "red")
+        return name
+    return name.translate(_DELIM_TABLE).lower()
 
 
 def _ensure_format(format: str) -> Sequence[rgba]:
@@ -383,51 +455,98 @@ def to_int(
     return value
 
 
+@lru_cache(maxsize=4096)
+def _parse_str(value: str) -> RGBA:
+    """Parse hex, rgb, rgba, hsl, hsla, and color name strings.
+
+    Results are memoized, since the same strings tend to be parsed repeatedly.
+    """
+    key = _norm_name(value)
+    if key in NAME_TO_RGB:
+        rgbai = NAME_TO_RGB[key]
+        return rgbai.to_float()
+    # both regexes are anchored to a literal prefix, so we only need to run
+    # the one that could possibly match
+    if value.startswith("rgb"):
+        if m := _parse_rgb_string(value):
+            return m.to_float()
+    elif value.startswith("hsl"):
+        if h := _parse_hsl_string(value):
+            return h.to_rgba()
+    else:
+        # anything else can only be a hex string ('#RGB', '#RRGGBB', '0xRRGGBB'...)
+        # no need to try (and fail) parsing rgb/hsl strings as hex
+        try:
+            return _parse_hex_string(value).to_float()
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid color string: {value!r}")
+
+
+def _parse_array(value: np.ndarray) -> RGBA:
+    """Parse a 3- or 4-element array of ints (0-255) or floats (0-1)."""
+    # convert to python scalars in a single pass,
+    # rather than iterating over numpy scalars
+    val = value.tolist()
+    if value.dtype.kind in "iu" and len(value) == 3:
+        return RGBA8(*_bound_0_255(val)).to_float()
+    if value.dtype.kind == "f" and len(value) in {3, 4}:
+        return RGBA(*_bound_0_1(val))
+    raise ValueError(f"Invalid color array: {value!r}")  # pragma: no cover
+
+
+def _parse_sequence(value: Sequence) -> RGBA:
+    """Parse a 3- or 4-sequence of ints (0-255) or floats (0-1)."""
+    r, g, b = value[:3]
+    if isinstance(r, int) and isinstance(g, int) and isinstance(b, int):
+        r, g, b = _bound_0_255((r, g, b))
+        a = _bound_0_1(value[3]) if len(value) > 3 else 1
+        return RGBA8(r, g, b, a).to_float()
+    return RGBA(*_bound_0_1(value))
+
+
+def _parse_pydantic_color(value: Any) -> RGBA:
+    """Parse a `pydantic.color.Color` or `pydantic_extra_types.color.Color`."""
+    r, g, b, *alpha = value.as_rgb_tuple()
+    return RGBA(r / 255, g / 255, b / 255, alpha[0] if alpha else 1)
+
+
+def _parse_colour_color(value: Any) -> RGBA:
+    """Parse a `colour.Color`."""
+    return RGBA(*_bound_0_1(value.get_rgb()))
+
+
+# (module name, parser) for third-party modules with a `Color` class
+_THIRD_PARTY_PARSERS: tuple[tuple[str, Callable[[Any], RGBA]], ...] = (
+    ("pydantic.color", _parse_pydantic_color),
+    ("pydantic_extra_types.color", _parse_pydantic_color),
+    ("colour", _parse_colour_color),
+)
+
+
 def parse_rgba(value: Any) -> RGBA:
     """Parse a color."""
+    # fast path: exact type lookup for the most common types
+    if (parser := _PARSERS.get(type(value))) is not None:
+        return parser(value)
+
+    # slow path: subclasses of the types above, and third-party color objects
     if isinstance(value, RGBA):
         return value
 
-    # parse hex, rgb, rgba, hsl, hsla, and color name strings
     if isinstance(value, str):
-        key = _norm_name(value)
-        if key in NAME_TO_RGB:
-            rgbai = NAME_TO_RGB[key]
-            return rgbai.to_float()
-        with contextlib.suppress(ValueError):
-            return _parse_hex_string(value).to_float()
-        if m := _parse_rgb_string(value):
-            return m.to_float()
-        if h := _parse_hsl_string(value):
-            return h.to_rgba()
-        raise ValueError(f"Invalid color string: {value!r}")
+        return _parse_str(value)
 
     # parse tuples/lists/arrays
     if isinstance(value, np.ndarray):
-        # val = tuple(np.squeeze(tuple(value)))
-        if np.issubdtype(value.dtype, np.integer) and len(value) == 3:
-            return RGBA8(*_bound_0_255(value)).to_float()
-        if np.issubdtype(value.dtype, np.floating) and len(value) in {3, 4}:
-            return RGBA(*_bound_0_1(cast("Sequence", value)))
-        raise ValueError(f"Invalid color array: {value!r}")  # pragma: no cover
+        return _parse_array(value)
 
     if isinstance(value, Sequence):
-        if isinstance(value, RGBA):
-            return value
         if isinstance(value, RGBA8):
             return value.to_float()
-        if all(isinstance(v, int) for v in value[:3]):
-            r, g, b = _bound_0_255(value[:3])
-            a = _bound_0_1(value[3]) if len(value) > 3 else 1
-            return RGBA8(r, g, b, a).to_float()
-        return RGBA(*_bound_0_1(value))
-
-    # None is transparent
-    if value is None:
-        return RGBA(0, 0, 0, 0)
+        return _parse_sequence(value)
 
     # support our own Color class
-
     if isinstance(value, Color):
         return value._rgba
 
@@ -435,23 +554,78 @@ def parse_rgba(value: Any) -> RGBA:
         # assume RGB24, use parse_int to explicitly pass format and bits_per_component
         return parse_int(value, "rgb")
 
-    # support for pydantic.color.Color
-    for mod in ("pydantic", "pydantic_extra_types"):
-        if (pydantic_color := sys.modules.get(f"{mod}.color")) and isinstance(
-            value, pydantic_color.Color
-        ):
-            r, g, b, *alpha = value.as_rgb_tuple()
-            return RGBA(r / 255, g / 255, b / 255, alpha[0] if alpha else 1)
-
-    # support for colour.Color
-    colour_color = sys.modules.get("colour")
-    if colour_color and isinstance(value, colour_color.Color):
-        return RGBA(*_bound_0_1(value.get_rgb()))
+    # support for third-party Color classes (only if their module is imported).
+    # The first time we see one, its type is added to the fast path in _PARSERS.
+    for modname, parser in _THIRD_PARTY_PARSERS:
+        if (mod := sys.modules.get(modname)) and isinstance(value, mod.Color):
+            _PARSERS[type(value)] = parser
+            return parser(value)
 
     raise TypeError(f"Cannot convert type {type(value)!r} to Color")
 
 
-_COLOR_CACHE: dict[RGBA, Color] = {}
+def parse_rgba_array(values: npt.ArrayLike) -> np.ndarray:
+    """Parse an (N, 3) or (N, 4) array of colors into an (N, 4) RGBA float array.
+
+    This is a vectorized version of `parse_rgba` for numeric arrays: integer arrays
+    are interpreted as 0-255 values (including alpha, if present), and float arrays
+    as 0-1 values.  Missing alpha values are set to 1, and the output is clipped to
+    the range 0-1.
+
+    Parameters
+    ----------
+    values : ArrayLike
+        An (N, 3) or (N, 4) array of RGB(A) values.
+
+    Returns
+    -------
+    np.ndarray
+        An (N, 4) array of RGBA values, all floats between 0 and 1.
+    """
+    ary = np.atleast_2d(np.asarray(values))
+    if ary.ndim != 2 or ary.shape[1] not in (3, 4):
+        raise ValueError(f"Expected an (N, 3) or (N, 4) array, got shape {ary.shape}")
+    ncols = ary.shape[1]
+    out = np.ones((len(ary), 4))
+    out[:, :ncols] = ary
+    if ary.dtype.kind in "iu":
+        out[:, :ncols] /= 255
+    return np.clip(out, 0, 1, out=out)
+
+
+def _rgba_array_to_hex(rgba: np.ndarray) -> list[str]:
+    """Format an (N, 4) RGBA float array as a list of hex strings.
+
+    Equivalent to `[Color(c).hex for c in rgba]`, but formatted straight from the
+    array, without creating a `Color` object for every row.
+    """
+    rgba = np.clip(rgba, 0, 1)  # (Color clamps its values too)
+    rgba8 = np.round(rgba * 255).astype(np.intp).tolist()
+    opaque = (rgba[:, 3] == 1).tolist()
+    return [
+        f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}" + ("" if o else _HEX[a])
+        for (r, g, b, a), o in zip(rgba8, opaque)
+    ]
+
+
+def _rgba_array_to_css(rgba: np.ndarray) -> list[str]:
+    """Format an (N, 4) RGBA float array as a list of `rgb[a]()` strings.
+
+    Equivalent to `[Color(c).rgba_string for c in rgba]`, but formatted straight from
+    the array, without creating a `Color` object for every row.
+    """
+    rgba = np.clip(rgba, 0, 1)  # (Color clamps its values too)
+    rgb8 = np.round(rgba[:, :3] * 255).astype(np.intp).tolist()
+    alpha = rgba[:, 3].tolist()
+    return [
+        f"rgb({r}, {g}, {b})" if a == 1 else f"rgba({r}, {g}, {b}, {a})"
+        for (r, g, b), a in zip(rgb8, alpha)
+    ]
+
+
+# Colors are only cached for as long as something else holds a reference to them
+# (named colors are kept alive by NAME_TO_COLOR, at the bottom of this module)
+_COLOR_CACHE: WeakValueDictionary[RGBA, Color] = WeakValueDictionary()
 
 
 class Color:
@@ -466,19 +640,42 @@ class Color:
         The color to represent.  Can be any "ColorLike".
     """
 
-    __slots__ = ("_rgba", "_name", "__weakref__")
+    __slots__ = (
+        "_rgba",
+        "_hash",
+        "_name",
+        "_hex",
+        "_hsl",
+        "_hsv",
+        "_rgba8",
+        "_rgba_string",
+        "__weakref__",
+    )
     _rgba: RGBA
+    _hash: int
+    # lazily computed (on first access) and then cached by the properties below
     _name: str | None
+    _hex: str
+    _hsl: HSLA
+    _hsv: HSVA
+    _rgba8: RGBA8
+    _rgba_string: str
 
     def __new__(cls, value: Any) -> Color:
+        if type(value) is str:
+            # fast path for (exactly spelled) named colors, built at import time
+            named = NAME_TO_COLOR.get(value)
+            if named is not None:
+                return named
         rgba = parse_rgba(value)
-        if rgba not in _COLOR_CACHE:
-            name = RGB_TO_NAME.get(rgba.to_8bit())
+        obj = _COLOR_CACHE.get(rgba)
+        if obj is None:
             obj = super().__new__(cls)
             object.__setattr__(obj, "_rgba", rgba)
-            object.__setattr__(obj, "_name", name)
+            # Color is often used as a dict key/set member: hash the 4 floats only once
+            object.__setattr__(obj, "_hash", hash(rgba))
             _COLOR_CACHE[rgba] = obj
-        return _COLOR_CACHE[rgba]
+        return obj
 
     @classmethod
     def from_int(
@@ -559,12 +756,20 @@ class Color:
     @property
     def hsl(self) -> HSLA:
         """Return the color as Hue, Saturation, Lightness."""
-        return self._rgba.to_hsl()
+        try:
+            return self._hsl
+        except AttributeError:
+            object.__setattr__(self, "_hsl", self._rgba.to_hsl())
+            return self._hsl
 
     @property
     def hsv(self) -> HSVA:
         """Return the color as Hue, Saturation, Value."""
-        return self._rgba.to_hsv()
+        try:
+            return self._hsv
+        except AttributeError:
+            object.__setattr__(self, "_hsv", self._rgba.to_hsv())
+            return self._hsv
 
     @property
     def rgba(self) -> RGBA:
@@ -574,25 +779,46 @@ class Color:
     @property
     def rgba8(self) -> RGBA8:
         """Return the color as (Red, Green, Blue, Alpha) tuple in 0-255 range."""
-        return self._rgba.to_8bit()
+        try:
+            return self._rgba8
+        except AttributeError:
+            object.__setattr__(self, "_rgba8", self._rgba.to_8bit())
+            return self._rgba8
 
     @property
     def rgba_string(self) -> str:
         """Return the color as an 'rgba(r, g, b, a)' string; 0-255 range."""
-        return self.rgba8.rgba_string()
+        try:
+            return self._rgba_string
+        except AttributeError:
+            object.__setattr__(self, "_rgba_string", self.rgba8.rgba_string())
+            return self._rgba_string
 
     @property
     def hex(self) -> str:
         """Return the color as hex."""
-        return self._rgba.to_hex()
+        try:
+            return self._hex
+        except AttributeError:
+            object.__setattr__(self, "_hex", self.rgba8.to_hex())
+            return self._hex
 
     @property
     def name(self) -> str | None:
         """Return the color as name."""
-        return self._name
+        try:
+            return self._name
+        except AttributeError:
+            r, g, b, a = self.rgba8
+            if a == 1:
+                name = RGB_TO_NAME.get((r << 16) | (g << 8) | b)
+            else:
+                name = TRANSPARENT_NAME if a == 0 and not (r or g or b) else None
+            object.__setattr__(self, "_name", name)
+            return self._name
 
     def __hash__(self) -> int:
-        return hash(self._rgba)
+        return self._hash
 
     def __eq__(self, __o: object) -> bool:
         if isinstance(__o, Color):
@@ -611,9 +837,10 @@ class Color:
         if self.name:
             arg: str | tuple = self.name
         else:
-            arg = tuple(round(float(x), 4) for x in tuple(self._rgba))
-            if self._rgba.a == 1:
-                arg = arg[:3]
+            r, g, b, a = self._rgba
+            arg = (round(float(r), 4), round(float(g), 4), round(float(b), 4))
+            if a != 1:
+                arg += (round(float(a), 4),)
         return f"{self.__class__.__name__}({arg!r})"
 
     def __rich_repr__(self) -> Any:
@@ -643,6 +870,20 @@ class Color:
         return str(self)
 
 
+# exact-type -> parser mapping, used for O(1) dispatch in `parse_rgba`
+_PARSERS: dict[type, Callable[[Any], RGBA]] = {
+    str: _parse_str,
+    tuple: _parse_sequence,
+    list: _parse_sequence,
+    np.ndarray: _parse_array,
+    RGBA: lambda v: v,
+    RGBA8: RGBA8.to_float,
+    Color: lambda v: v._rgba,
+    int: lambda v: parse_int(v, "rgb"),  # assume RGB24
+    type(None): lambda v: RGBA(0, 0, 0, 0),  # None is transparent
+}
+
+
 ALL_COLORS: dict[str, tuple[int, ...]] = {
     # https://www.w3.org/TR/CSS1/
     "black": (0, 0, 0),
@@ -807,14 +1048,18 @@ ALL_COLORS: dict[str, tuple[int, ...]] = {
     "none": (0, 0, 0, 0),
 }
 NAME_TO_RGB = {name: RGBA8(*values) for name, values in ALL_COLORS.items()}
-RGB_TO_NAME = {v: name for name, v in NAME_TO_RGB.items()}
+# reverse lookup of (opaque) named colors, keyed by packed 24-bit RGB integers
+RGB_TO_NAME = {
+    (v.r << 16) | (v.g << 8) | v.b: name for name, v in NAME_TO_RGB.items() if v.a == 1
+}
 # for a few names with aliases... make sure the canonical name is used
-RGB_TO_NAME[RGBA8(255, 0, 0)] = "red"
-RGB_TO_NAME[RGBA8(0, 255, 0)] = "lime"  # unfortunate, but true
-RGB_TO_NAME[RGBA8(0, 0, 255)] = "blue"
-RGB_TO_NAME[RGBA8(255, 255, 0)] = "yellow"
-RGB_TO_NAME[RGBA8(0, 255, 255)] = "cyan"
-RGB_TO_NAME[RGBA8(255, 0, 255)] = "magenta"
-RGB_TO_NAME[RGBA8(128, 128, 128)] = "gray"
-RGB_TO_NAME[RGBA8(0, 0, 0)] = "black"
-RGB_TO_NAME[RGBA8(255, 255, 255)] = "white"
+# (including "lime" for pure green... unfortunate, but true)
+for _name in "red lime blue yellow cyan magenta gray black white".split():
+    _v = NAME_TO_RGB[_name]
+    RGB_TO_NAME[(_v.r << 16) | (_v.g << 8) | _v.b] = _name
+del _name, _v
+# name of (0, 0, 0, 0): "transparent" and "none" are the only non-opaque named colors
+TRANSPARENT_NAME = "none"
+
+# pre-instantiate all named colors, which also keeps them alive in _COLOR_CACHE
+NAME_TO_COLOR = {name: Color(rgb.to_float()) for name, rgb in NAME_TO_RGB.items()}
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import base64
 import warnings
-from functools import partial
+from copy import copy
+from functools import lru_cache, partial
 from numbers import Number
 from typing import TYPE_CHECKING, Any, NamedTuple, Sequence, cast, overload
 
@@ -11,7 +12,12 @@ import numpy.typing as npt
 
 from . import _external
 from ._catalog import Catalog
-from ._color import Color
+from ._color import (
+    Color,
+    _rgba_array_to_css,
+    _rgba_array_to_hex,
+    parse_rgba_array,
+)
 
 if TYPE_CHECKING:
     from typing import Callable, Iterable, Iterator, Literal, Union
@@ -31,7 +37,7 @@ if TYPE_CHECKING:
     from ._catalog import CatalogItem
     from ._color import ColorLike
 
-    LutCacheKey = tuple[int, float, bool]
+    LutCacheKey = tuple[int, float, bool, bool]
     Interpolation = Literal["linear", "nearest"]
     LutCallable: TypeAlias = Callable[[NDArray], NDArray]
     ColorStopLike: TypeAlias = Union[tuple[float, ColorLike], np.ndarray]
@@ -60,6 +66,10 @@ if TYPE_CHECKING:
 
 
 BAD_COLOR = (0.0, 0.0, 0.0, 0.0)
+# maximum number of LUTs cached per colormap (and shared between colormaps)
+_LUT_CACHE_SIZE = 128
+# bumped by Colormap.set_lut_cache_size, to clear the per-colormap caches
+_LUT_CACHE_GEN = 0
 
 
 class Colormap:
@@ -131,7 +141,10 @@ class Colormap:
         "over_color",
         "under_color",
         "_initialized",
+        "_last_lut",
         "_lut_cache",
+        "_lut_cache_gen",
+        "_png",
         "__weakref__",
     )
 
@@ -195,6 +208,10 @@ class Colormap:
     will be the last color in the LUT (`lut[-1]`).
     """
 
+    _png: bytes  # lazily cached default _repr_png_
+    _last_lut: tuple[LutCacheKey, np.ndarray]  # most recent lut() call
+    _lut_cache_gen: int  # value of _LUT_CACHE_GEN when _lut_cache was last used
+
     _catalog_instance: Catalog | None = None
 
     @classmethod
@@ -216,6 +233,8 @@ class Colormap:
         over: ColorLike | None = None,
         bad: ColorLike | None = None,
     ) -> None:
+        # set directly so that __setattr__ can read the slot without a default
+        object.__setattr__(self, "_initialized", False)
         self.info: CatalogItem | None = None
 
         if isinstance(value, str):
@@ -227,23 +246,9 @@ class Colormap:
             under = info.under if under is None else under
             bad = info.bad if bad is None else bad
             self.info = info
-            if isinstance(info.data, list):
-                ld = len(info.data[0])
-                if ld == 2:
-                    # if it's a list of tuples, it's a list of color stops
-                    stops = ColorStops._from_uniform_stops(info.data)
-                elif ld == 3:
-                    stops = ColorStops._from_colorarray_like(info.data)
-                else:  # pragma: no cover
-                    raise ValueError(
-                        f"Invalid catalog colormap data for {info.name!r}: {info.data}"
-                    )
-            else:
-                stops = _parse_colorstops(info.data)
+            stops = _catalog_color_stops(info, rev)
             if interpolation is None:
                 interpolation = info.interpolation
-            if rev:
-                stops = stops.reversed()
         elif isinstance(value, Colormap):
             name = name or value.name
             identifier = identifier or value.identifier
@@ -271,6 +276,7 @@ class Colormap:
         self.bad_color = None if bad is None else Color(bad)
 
         self._lut_cache: dict[LutCacheKey, np.ndarray] = {}
+        self._lut_cache_gen = _LUT_CACHE_GEN
         self._initialized = True
 
     @overload
@@ -281,6 +287,7 @@ class Colormap:
         N: int = 256,
         gamma: float = 1,
         bytes: bool = False,
+        out: NDArray | None = None,
     ) -> NDArray[np.float64]: ...
     @overload
     def __call__(
@@ -298,6 +305,7 @@ class Colormap:
         N: int = 256,
         gamma: float = 1,
         bytes: bool = False,
+        out: NDArray | None = None,
     ) -> Color | NDArray[np.float64]:
         r"""Map scalar values in X to an RGBA array.
 
@@ -328,6 +336,12 @@ class Colormap:
             If False (default), the returned RGBA values will be floats in the
             interval ``[0, 1]`` otherwise they will be `numpy.uint8`\s in the
             interval ``[0, 255]``.
+        out : NDArray | None
+            An optional array to write the result into, with shape `x.shape + (4,)`
+            and dtype `float64` (or `uint8` if `bytes` is True).  Passing the same
+            array when repeatedly mapping same-shaped data (e.g. frames of a movie)
+            avoids allocating a new output array for each call.  Ignored if `x` is a
+            scalar.
 
         Returns
         -------
@@ -346,36 +360,76 @@ class Colormap:
         >>> data = data / data.max()  # normalize to 0-1
         >>> colored_img = cmap(data)
         """
-        lut = self.lut(N=N, gamma=gamma, with_over_under=True)
-        if bytes:
-            lut = (lut * 255).astype(np.uint8)
+        lut = self.lut(N=N, gamma=gamma, with_over_under=True, bytes=bytes)
         # the lut will have three additional colors at the end for under, over, and bad
         N = len(lut) - 3
 
-        xa = np.array(x, copy=True)
-        if not xa.dtype.isnative:
-            # Native byteorder is faster.
-            native: Literal[">", "<"] = ">" if xa.dtype.byteorder in ("<", "=") else "<"
-            xa = xa.view(xa.dtype.newbyteorder(native))
+        if isinstance(x, float):
+            # single float: same index math as the array path below, in plain python
+            xf = x * N
+            if xf != xf:  # nan
+                i = N + 2
+            elif xf < 0:
+                i = N
+            elif xf > N:
+                i = N + 1
+            else:
+                i = min(int(xf), N - 1)
+            return Color(lut[i])
+        if isinstance(x, (int, np.integer)):
+            # single int: a direct index into the LUT, as in the array path below
+            i = N if x < 0 else N + 1 if x >= N else int(x)
+            return Color(lut[i])
+
+        xa = np.asarray(x)
+        if xa.dtype.kind == "O":
+            # e.g. an object array of python floats (which must not be truncated to
+            # indices by the integer branch below)
+            xa = xa.astype(float)
+        if (
+            xa.dtype.kind == "u"
+            and not np.ma.is_masked(x)
+            and (np.iinfo(xa.dtype).max < N or xa.max(initial=0) < N)
+        ):
+            # every value is a valid index into the LUT (always true for e.g. uint8
+            # with N=256, otherwise checked with a single reduction): there is
+            # nothing to mask, so skip the copy, cast and masking
+            rgba = lut.take(xa, axis=0, out=out, mode="clip")
+            return rgba if np.iterable(x) else Color(rgba)
+
+        # (no byte order handling is needed for non-native input: both branches below
+        # start with an operation that produces native values, xa * N or astype)
+        masked = np.ma.is_masked(x)
         if xa.dtype.kind == "f":
-            xa *= N
-            # xa == 1 (== N after multiplication) is not out of range.
-            xa[xa == N] = N - 1
-
-        mask_under = xa < 0
-        mask_over = xa >= N
-        # If input was masked, get the bad mask from it; else mask out nans.
-        mask_bad = x.mask if np.ma.is_masked(x) else np.isnan(xa)  # type: ignore
-
-        with np.errstate(invalid="ignore"):
-            # We need this cast for unsigned ints as well as floats
-            xa = xa.astype(int)
-
-        xa[mask_under] = N
-        xa[mask_over] = N + 1
-        xa[mask_bad] = N + 2
-
-        rgba = lut.take(xa, axis=0, mode="clip")
+            # (a new array, so the caller's data is never modified; asarray keeps
+            # 0-d inputs as arrays rather than numpy scalars)
+            xa = np.asarray(xa * N)
+            with np.errstate(invalid="ignore"):
+                idx = xa.astype(np.intp)
+            # xa == 1 (== N after multiplication) is not out of range: it maps to the
+            # last color
+            np.minimum(idx, N - 1, out=idx)
+            # normalized data usually lies entirely within [0, N] (nan fails both
+            # comparisons), and then there is nothing to mark as under, over or bad
+            if not (xa.min(initial=0) >= 0 and xa.max(initial=N) <= N):
+                idx[xa < 0] = N
+                idx[xa > N] = N + 1
+                if not masked:
+                    idx[np.isnan(xa)] = N + 2
+        else:
+            # We need this cast for unsigned ints as well
+            idx = xa.astype(np.intp)
+            idx[xa < 0] = N
+            idx[xa >= N] = N + 1
+
+        # If input was masked, get the bad mask from it (else nans were handled above)
+        if masked:
+            idx[x.mask] = N + 2  # type: ignore
+
+        # mode="clip" lets take() write straight into `out` (it buffers it in "raise"
+        # mode), and it bounds any garbage left from casting nan/inf to int (e.g.
+        # nans of masked input that are not masked), so every index is valid
+        rgba = lut.take(idx, axis=0, out=out, mode="clip")
         return rgba if np.iterable(x) else Color(rgba)
 
     def with_extremes(
@@ -409,9 +463,14 @@ class Colormap:
         }
 
     def lut(
-        self, N: int = 256, gamma: float = 1, *, with_over_under: bool = False
+        self,
+        N: int = 256,
+        gamma: float = 1,
+        *,
+        with_over_under: bool = False,
+        bytes: bool = False,
     ) -> np.ndarray:
-        """Return a lookup table (LUT) for the colormap.
+        r"""Return a lookup table (LUT) for the colormap.
 
         The returned LUT is a numpy array of RGBA values, with shape (N, 4), where N is
         the number of requested colors in the LUT. If `with_over_under`
@@ -424,7 +483,8 @@ class Colormap:
         The output of this function is used by the `__call__` method, but may also
         be used directly by users.
 
-        LUTs of a particular size and gamma value are cached.
+        LUTs of a particular size, gamma value, and dtype are cached (see
+        [`Colormap.set_lut_cache_size`][cmap.Colormap.set_lut_cache_size]).
 
         Parameters
         ----------
@@ -436,24 +496,135 @@ class Colormap:
             If True, the LUT will include the under, over, and bad colors as the
             last three colors in the LUT.  If False, the LUT will only include the
             colors defined by the color_stops.
+        bytes : bool
+            If False (default), the LUT will contain floats in the interval ``[0, 1]``,
+            otherwise it will contain `numpy.uint8`\s in the interval ``[0, 255]``.
         """
-        key = (N, gamma, with_over_under)
-        if key not in self._lut_cache:
+        key = (N, gamma, with_over_under, bytes)
+        if _LUT_CACHE_SIZE > 0:
+            if self._lut_cache_gen != _LUT_CACHE_GEN:
+                # the cache size was changed since this cache was last used (the
+                # remembered last LUT is discarded too: it is replaced below)
+                self._lut_cache.clear()
+                object.__setattr__(self, "_lut_cache_gen", _LUT_CACHE_GEN)
+            else:
+                try:
+                    # repeated calls with the same arguments skip hashing the key
+                    last_key, last_lut = self._last_lut
+                    if last_key == key:
+                        return last_lut
+                except AttributeError:
+                    pass
+                if (lut := self._lut_cache.pop(key, None)) is not None:
+                    # re-inserted as the most recently used entry
+                    self._lut_cache[key] = lut
+                    object.__setattr__(self, "_last_lut", (key, lut))
+                    return lut
+
+        if bytes:
+            # derived from (and cached alongside) the float LUT
+            lut = self.lut(N, gamma, with_over_under=with_over_under)
+            lut = (lut * 255).astype(np.uint8)
+        elif not with_over_under:
             lut = self.color_stops.to_lut(N, gamma)
+        else:
+            # (the extended array below is a copy, so the shared LUT may be used)
+            lut = self.color_stops._to_lut(N, gamma)
+            under = lut[0] if self.under_color is None else self.under_color.rgba
+            over = lut[-1] if self.over_color is None else self.over_color.rgba
+            bad = BAD_COLOR if self.bad_color is None else self.bad_color.rgba
+            # expand (N, 4) lut to (N+3, 4) to include under, over, and bad colors
+            # (a single allocation; note that lut is 1D if N == 1)
+            ext = np.empty((len(np.atleast_2d(lut)) + 3, 4))
+            ext[:-3] = lut
+            ext[-3] = under
+            ext[-2] = over
+            ext[-1] = bad
+            lut = ext
+
+        if _LUT_CACHE_SIZE > 0:
+            # evict the least recently used LUTs once the (per-colormap) cache is full
+            while len(self._lut_cache) >= _LUT_CACHE_SIZE:
+                del self._lut_cache[next(iter(self._lut_cache))]
+            self._lut_cache[key] = lut
+            object.__setattr__(self, "_last_lut", (key, lut))
+        return lut
 
-            if with_over_under:
-                under = lut[0] if self.under_color is None else self.under_color.rgba
-                over = lut[-1] if self.over_color is None else self.over_color.rgba
-                bad = BAD_COLOR if self.bad_color is None else self.bad_color.rgba
-                # expand (N, 4) lut to (N+3, 4) to include under, over, and bad colors
-                lut = np.vstack((lut, np.zeros((3, 4))))
-                lut[-3] = under
-                lut[-2] = over
-                lut[-1] = bad
+    @staticmethod
+    def set_lut_cache_size(size: int) -> None:
+        """Set the maximum number of LUTs that are cached (128 by default).
 
-            self._lut_cache[key] = lut
+        This limits both the LUTs cached on each `Colormap` (one for each combination
+        of arguments passed to [`Colormap.lut`][cmap.Colormap.lut]) and the
+        interpolated LUTs that are shared between colormaps with identical color stops.
+        Use 0 to disable caching.  Changing the size clears all of these caches.
+        """
+        global _LUT_CACHE_SIZE, _LUT_CACHE_GEN, _interpolate_stops_cached
+        _LUT_CACHE_SIZE = max(size, 0)
+        _LUT_CACHE_GEN += 1
+        _interpolate_stops_cached = lru_cache(maxsize=_LUT_CACHE_SIZE)(
+            _interpolate_stops_cached.__wrapped__
+        )
+
+    def packed_lut(self, N: int = 256, gamma: float = 1) -> np.ndarray:
+        """Return the LUT packed as one `numpy.uint32` (RGBA8888) word per color.
+
+        Each word holds the four 8-bit channels of `lut(N, gamma, bytes=True)` in
+        memory order (R, G, B, A), so the result can be copied directly into RGBA8
+        image or texture buffers.  It is a view of the cached uint8 LUT, so it is
+        essentially free once that has been computed.
 
-        return self._lut_cache[key]
+        Note that the numeric value of each word depends on the platform byte order
+        (on little-endian machines it reads as ``0xAABBGGRR``).
+
+        Parameters
+        ----------
+        N : int
+            The number of colors in the LUT.
+        gamma : float
+            The gamma value to use for the LUT.
+        """
+        return self.lut(N, gamma, bytes=True).view(np.uint32).ravel()
+
+    def lookup(
+        self,
+        idx: int | ArrayLike,
+        N: int = 256,
+        gamma: float = 1,
+        *,
+        bytes: bool = False,
+    ) -> np.ndarray:
+        r"""Return the colors at integer positions `idx` of the LUT.
+
+        This is equivalent to ``self.lut(N, gamma, bytes=bytes).take(idx, axis=0)``:
+        a direct gather for callers that have already converted their data to LUT
+        indices, without any of the normalization or under/over/bad handling done by
+        [`Colormap.__call__`][cmap.Colormap.__call__].
+
+        Parameters
+        ----------
+        idx : int | array-like
+            Integer indices into the LUT, in the range ``[0, N)``.  An `IndexError` is
+            raised for indices outside of that range.
+        N : int
+            The number of colors in the LUT.
+        gamma : float
+            The gamma value to use for the LUT.
+        bytes : bool
+            If False (default), the returned RGBA values will be floats in the
+            interval ``[0, 1]`` otherwise they will be `numpy.uint8`\s in the
+            interval ``[0, 255]``.
+
+        Returns
+        -------
+        colors : np.ndarray
+            Array of RGBA colors with shape ``np.shape(idx) + (4,)``.
+        """
+        indices = np.asarray(idx)
+        if (low := indices.min(initial=0)) < 0:
+            # take() would wrap negative indices around to the end of the LUT
+            raise IndexError(f"index {low} is out of bounds for a LUT of size {N}")
+        return self.lut(N, gamma, bytes=bytes).take(indices, axis=0)
 
     def iter_colors(self, N: Iterable[float] | int | None = None) -> Iterator[Color]:
         """Return a list of N color objects sampled evenly over the range of the LUT.
@@ -474,11 +645,19 @@ class Colormap:
         color: Color
             Color objects.
         """
+        for c in self._sample_rgba(N).tolist():
+            yield Color(c)
+
+    def _sample_rgba(self, N: Iterable[float] | int | None = None) -> np.ndarray:
+        """Return the (M, 4) RGBA array that `iter_colors` wraps in Color objects.
+
+        For callers that only need the values (e.g. to format them), this avoids
+        creating a `Color` for every sample.
+        """
         if N is None:
             N = self.num_colors
-        nums = np.linspace(0, 1, N) if isinstance(N, int) else np.asarray(N)
-        for c in self(nums, N=len(nums)):
-            yield Color(c)
+        nums = _gamma_xind(N, 1) if isinstance(N, int) else np.asarray(N)
+        return self(nums, N=len(nums))
 
     def reversed(self, name: str | None = None) -> Colormap:
         """Return a new Colormap, with reversed colors.
@@ -580,7 +759,7 @@ class Colormap:
         return len(self.color_stops)
 
     def __setattr__(self, _name: str, _value: Any) -> None:
-        if getattr(self, "_initialized", False):
+        if self._initialized:
             raise AttributeError("Colormap is immutable")
         object.__setattr__(self, _name, _value)
 
@@ -589,6 +768,8 @@ class Colormap:
         return self.__class__, (self.color_stops,)
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, Colormap):
             try:
                 other = Colormap(other)  # type: ignore
@@ -614,8 +795,22 @@ class Colormap:
         """Generate a PNG representation of the Colormap."""
         from ._png import encode_png
 
-        X = img if img is not None else np.tile(np.linspace(0, 1, width), (height, 1))
-        return encode_png(self(X, bytes=True))
+        if img is not None:
+            return encode_png(self(img, bytes=True))
+
+        default = width == 512 and height == 48
+        if default:
+            # the colormap is immutable, so the default (notebook) image is reused
+            try:
+                return self._png
+            except AttributeError:
+                pass
+        # every row of the gradient is the same: map one and repeat it
+        row = self(np.linspace(0, 1, width), bytes=True)
+        png = encode_png(np.tile(row, (height, 1, 1)))
+        if default:
+            object.__setattr__(self, "_png", png)
+        return png
 
     def _repr_html_(self) -> str:
         """Generate an HTML representation of the Colormap."""
@@ -852,17 +1047,20 @@ class ColorStops(Sequence[ColorStop]):
                     raise ValueError("Expected (N, 5) array")  # pragma: no cover
                 self._stops = stops
             else:
-                self._stops = np.array([(p, *tuple(c)) for p, c in stops])
+                # fill the positions and colors columns of a preallocated array
+                _stops = list(stops)
+                self._stops = np.empty((len(_stops), 5))
+                if _stops:
+                    self._stops[:, 0] = [p for p, _ in _stops]
+                    self._stops[:, 1:] = [tuple(c) for _, c in _stops]
 
     def _call_lut_func(self, X: np.ndarray) -> np.ndarray:
         if self._lut_func is None:
             raise ValueError("No lut_func provided")  # pragma: no cover
-        colors = np.atleast_2d(np.clip(self._lut_func(X), 0, 1))
-        if colors.shape[1] == 3:
-            colors = np.concatenate([colors, np.ones((len(X), 1))], axis=1)
-        elif colors.shape[1] != 4:
+        colors = np.atleast_2d(self._lut_func(X))
+        if colors.shape[1] not in (3, 4):
             raise ValueError("lut_func must return RGB or RGBA values")
-        return cast("np.ndarray", colors)
+        return parse_rgba_array(colors.astype(float, copy=False))
 
     @classmethod
     def parse(cls, colors: ColorStopsLike) -> ColorStops:
@@ -899,9 +1097,12 @@ class ColorStops(Sequence[ColorStop]):
         Faster constructor for a list of [(position, (r, g, b, a?)), ...] tuples.
         This performs no color checking, clipping, or normalization.
         """
-        ary = np.asarray([(x, *rest) for x, rest in stops])
-        if ary.shape[1] == 4:
-            ary = np.concatenate([ary, np.ones((len(ary), 1))], axis=1)
+        colors = [rest for _, rest in stops]
+        # alpha column stays 1 when the stops are (r, g, b)
+        ary = np.ones((len(colors), 5))
+        ary[:, 0] = [x for x, _ in stops]
+        if colors:
+            ary[:, 1 : 1 + len(colors[0])] = colors
         return cls(ary)
 
     @classmethod
@@ -909,15 +1110,14 @@ class ColorStops(Sequence[ColorStop]):
         """Create a ColorStops object from a sequence of colors.
 
         Faster constructor for a list of [(r, g, b, a?), ...] colors
-        This performs no color checking, clipping, or normalization.
+        Integer colors are scaled to 0-1, and all values are clipped to [0, 1]
+        (see `parse_rgba_array`), but no other color checking is performed.
         """
-        ary = np.asarray(colors)
-        if np.issubdtype(ary.dtype, np.integer):
-            ary = ary / 255
-        if ary.shape[1] == 3:
-            ary = np.concatenate([ary, np.ones((len(ary), 1))], axis=1)
-        stops = np.linspace(0, 1, len(ary))
-        return cls(np.concatenate([stops[:, None], ary], axis=1))
+        rgba = parse_rgba_array(colors)
+        ary = np.empty((len(rgba), 5))
+        ary[:, 0] = _gamma_xind(len(rgba), 1)
+        ary[:, 1:] = rgba
+        return cls(ary)
 
     @property
     def stops(self) -> tuple[float, ...]:
@@ -932,7 +1132,9 @@ class ColorStops(Sequence[ColorStop]):
     @property
     def color_array(self) -> np.ndarray:
         """Return an (N, 4) array of RGBA values."""
-        return self._stops[:, 1:]
+        colors = self._stops[:, 1:]
+        # (catalog stops are shared between colormaps and read-only: copy those)
+        return colors if colors.flags.writeable else colors.copy()
 
     def __len__(self) -> int:
         return len(self._stops)
@@ -971,7 +1173,10 @@ class ColorStops(Sequence[ColorStop]):
 
     def __array__(self, dtype: npt.DTypeLike = None) -> np.ndarray:
         """Return (N, 5) array, N rows of (position, r, g, b, a)."""
-        return self._stops if dtype is None else self._stops.astype(dtype)
+        if dtype is not None:
+            return self._stops.astype(dtype)
+        # (catalog stops are shared between colormaps and read-only: copy those)
+        return self._stops if self._stops.flags.writeable else self._stops.copy()
 
     def __repr__(self) -> str:
         """Return a string representation of the ColorStops."""
@@ -987,12 +1192,19 @@ class ColorStops(Sequence[ColorStop]):
         return f"ColorStops(\n  {m}\n)"
 
     def __eq__(self, __o: object) -> bool:
+        if __o is self:
+            return True
         if not isinstance(__o, ColorStops):
             try:
                 __o = ColorStops.parse(__o)  # type: ignore
             except Exception:
                 return NotImplemented
-        return np.allclose(self._stops, __o._stops)
+        if self._stops.shape != __o._stops.shape:
+            return False
+        # identical stops (e.g. the same colormap loaded twice) need only a memcmp
+        return self._stops_bytes == __o._stops_bytes or np.allclose(
+            self._stops, __o._stops
+        )
 
     def to_lut(self, N: int = 256, gamma: float = 1.0) -> np.ndarray:
         """Create (N, 4) LUT of RGBA values from 0-1, interpolated between color stops.
@@ -1004,11 +1216,18 @@ class ColorStops(Sequence[ColorStop]):
         gamma : float
             Gamma correction to apply to the colors.
         """
+        lut = self._to_lut(N, gamma)
+        # (never hand out the shared, read-only LUTs)
+        return lut if lut.flags.writeable else lut.copy()
+
+    def _to_lut(self, N: int = 256, gamma: float = 1.0) -> np.ndarray:
+        """Like `to_lut`, but may return a LUT that is shared (and read-only)."""
         if self._interpolation == "nearest":
             return self.color_array
 
         if self._lut_func is not None:
-            return self._call_lut_func(np.linspace(0, 1, N) ** gamma)
+            # (a copy of the shared positions, the lut_func is free to modify it)
+            return self._call_lut_func(_gamma_xind(N, gamma).copy())
 
         # the 50 is a magic number... we're just saying "if a lot of colors are being
         # requested, and that number is one more than the number of stops, then just
@@ -1017,7 +1236,18 @@ class ColorStops(Sequence[ColorStop]):
         if 50 < len(self._stops) == N + 1:
             # no interpolation needed
             return self.color_array
-        return _interpolate_stops(N, self._stops, gamma)
+        # LUTs are cached at the module level, so that colormaps with identical stops
+        # (e.g. the same catalog colormap instantiated repeatedly) share them.
+        return _interpolate_stops_cached(self._stops_bytes, N, gamma)
+
+    @property
+    def _stops_bytes(self) -> bytes:
+        """The (N, 5) float64 stops array as bytes (used as a key).
+
+        This is not cached: the stops may be modified in place (e.g. through
+        `np.asarray(stops)`), and a single copy of the array is cheap.
+        """
+        return np.ascontiguousarray(self._stops, dtype=np.float64).tobytes()
 
     def to_css(
         self,
@@ -1040,13 +1270,15 @@ class ColorStops(Sequence[ColorStop]):
             If `True`, return colors as hex strings, by default use `rgba()` strings.
         """
         if max_stops and len(self._stops) > max_stops:
-            stops = tuple(np.linspace(0, 1, max_stops))
-            colors = tuple(Color(c) for c in self.to_lut(max_stops))
+            stops = _gamma_xind(max_stops, 1).tolist()
+            rgba = self._to_lut(max_stops)
         else:
-            stops, colors = self.stops, self.colors
-        if not colors:
+            stops, rgba = self._stops[:, 0].tolist(), self.color_array
+        if not len(rgba):
             return ""
-        out = f"background: {colors[0].hex if as_hex else colors[0].rgba_string};\n"
+        # format all colors at once, straight from the RGBA array
+        colors = _rgba_array_to_hex(rgba) if as_hex else _rgba_array_to_css(rgba)
+        out = f"background: {colors[0]};\n"
         type_ = "radial" if radial else "linear"
         if self._interpolation == "nearest":
             # if we're using nearest interpolation, for css we can create double stops
@@ -1058,20 +1290,13 @@ class ColorStops(Sequence[ColorStop]):
             # I think we have the same problem with the real colormaps too though.
             # (mpl ListedColormap assumes even spacing too though, so this is unlikely
             # to be a problem in practice)
-            midpoints = np.linspace(0, 1, len(colors) + 1)[1:-1]
+            midpoints = _gamma_xind(len(colors) + 1, 1)[1:-1].tolist()
             _midstops = []
-            for m, (c1, c2) in zip(midpoints, zip(colors[:-1], colors[1:])):
-                s1 = f"{c1.hex if as_hex else c1.rgba_string} {m*100:g}%"
-                s2 = f"{c2.hex if as_hex else c2.rgba_string} {m*100:g}%"
-                _midstops.extend([s1, s2])
+            for m, c1, c2 in zip(midpoints, colors[:-1], colors[1:]):
+                _midstops.extend([f"{c1} {m*100:g}%", f"{c2} {m*100:g}%"])
             _stops = ", ".join(_midstops)
         else:
-            _stops = ", ".join(
-                [
-                    f"{c.hex if as_hex else c.rgba_string} {s*100:g}%"
-                    for c, s in zip(colors, stops)
-                ]
-            )
+            _stops = ", ".join([f"{c} {s*100:g}%" for c, s in zip(colors, stops)])
         angle_ = "" if radial else f"{angle}deg, "
         out += f"background: {type_}-gradient({angle_}{_stops});\n"
         return out
@@ -1095,9 +1320,11 @@ class ColorStops(Sequence[ColorStop]):
                 # partial to maintain picklability
                 rev_lutfunc = partial(self._reverser, lut_func)
             return type(self)(lut_func=rev_lutfunc)
-        # invert the positions in the stops
-        rev_stops = self._stops[::-1]
-        rev_stops[:, 0] = 1 - rev_stops[:, 0]
+        # invert the positions in the stops (into a new array: slicing self._stops
+        # with [::-1] would be a view, and writing to it would modify this object)
+        rev_stops = np.empty_like(self._stops)
+        rev_stops[:, 0] = 1 - self._stops[::-1, 0]
+        rev_stops[:, 1:] = self._stops[::-1, 1:]
         return type(self)(rev_stops, interpolation=self._interpolation)
 
     def shifted(
@@ -1205,27 +1432,15 @@ def _fill_stops(
         _stops[0] = 0.0
     if _stops[-1] is None:
         _stops[-1] = 1.0
+    if None not in _stops:
+        return cast("list[float]", _stops)
 
-    out: list[float] = []
-    last_val: tuple[int, float] = (0, 0.0)
-    in_gap = False  # marks whether we are in a series of Nones
-    for idx, stop in enumerate(_stops):
-        if stop is not None:
-            if in_gap:
-                # if we are at the first value after a series of Nones, then
-                # fill in the Nones with values spaced evenly between the
-                # previous value and the current value.
-                _idx, _stop = last_val
-                filler = np.linspace(_stop, stop, idx - _idx + 1)
-                out.extend(filler[1:])
-                in_gap = False
-            else:
-                # otherwise, just append the current value
-                out.append(stop)
-            last_val = (idx, stop)
-        else:
-            in_gap = True
-    return out
+    # fill in the Nones with values spaced evenly between the closest specified
+    # values before and after them (i.e. interpolate linearly by index)
+    arr = np.array([np.nan if s is None else s for s in _stops], dtype=float)
+    known = np.flatnonzero(~np.isnan(arr))
+    filled = np.interp(np.arange(len(arr)), known, arr[known])
+    return cast("list[float]", filled.tolist())
 
 
 def _interpolate_stops(N: int, data: ArrayLike, gamma: float = 1.0) -> np.ndarray:
@@ -1264,16 +1479,22 @@ def _interpolate_stops(N: int, data: ArrayLike, gamma: float = 1.0) -> np.ndarra
     lut : np.ndarray
         (N, 4) LUT of RGBA values, interpolated between color stops.
     """
-    adata = np.atleast_2d(np.array(data))
+    adata = np.atleast_2d(np.asarray(data))  # (not modified below, no need to copy)
     if adata.shape[1] < 2:  # pragma: no cover
         raise ValueError("data must have at least 2 columns")
 
     # make sure the first and last stops are at 0 and 1 ...
     # adding additional control points that copy the first/last color if needed
-    if adata[0, 0] != 0.0:
-        adata = np.vstack([[0.0, *adata[0, 1:]], adata])
-    if adata[-1, 0] != 1.0:
-        adata = np.vstack([adata, [1.0, *adata[-1, 1:]]])
+    front, back = int(adata[0, 0] != 0.0), int(adata[-1, 0] != 1.0)
+    if front or back:
+        # (a single allocation for both ends, rather than stacking one at a time)
+        padded = np.empty((len(adata) + front + back, adata.shape[1]))
+        padded[front : len(padded) - back] = adata
+        if front:
+            padded[0, 0], padded[0, 1:] = 0.0, adata[0, 1:]
+        if back:
+            padded[-1, 0], padded[-1, 1:] = 1.0, adata[-1, 1:]
+        adata = padded
 
     x = adata[:, 0]
     rgba = adata[:, 1:]
@@ -1286,18 +1507,23 @@ def _interpolate_stops(N: int, data: ArrayLike, gamma: float = 1.0) -> np.ndarra
     # begin generation of lookup table
     if N == 1:
         # convention: use the y = f(x=1) value for a 1-element lookup table
-        lut = rgba[-1]
+        # (a copy, since it is clipped in place below)
+        lut: np.ndarray = rgba[-1].copy()
     else:
         # sourcery skip: extract-method
         # scale stop positions to the number of elements (-1) in the LUT
         x = x * (N - 1)
         # create evenly spaced LUT indices with gamma correction
-        xind = np.linspace(0, 1, N) ** gamma
+        xind = _gamma_xind(N, gamma)
         # scale to the number of elements (-1) in the LUT, and exclude exterior values
         xind = ((N - 1) * xind)[1:-1]
         # Find the indices in the scaled positions array `x` that each element in
         # `xind` would need to be inserted before to maintain order.
-        ind = np.searchsorted(x, xind)
+        ind = x.searchsorted(xind)
+        # x spans [0, N - 1] and xind normally lies strictly inside it, but an extreme
+        # gamma can push xind onto an end (e.g. underflow to 0): keep every ind a
+        # valid interval, so that `ind - 1` below never wraps around to x[-1]
+        np.clip(ind, 1, len(x) - 1, out=ind)
         # calculate the fractional distance between the two values in `x` that
         # each element in `xind` is between. (this is the position at which we need
         # to sample between the neighboring color stops)
@@ -1306,23 +1532,57 @@ def _interpolate_stops(N: int, data: ArrayLike, gamma: float = 1.0) -> np.ndarra
         # the value at `frac_dist` between the neighboring color stops
         start = rgba[ind - 1]
         length = rgba[ind] - start
-        interpolated_points = frac_dist[:, np.newaxis] * length + start
-        # concatenate the first and last color stops with the interpolated values
-        lut = np.concatenate([[rgba[0]], interpolated_points, [rgba[-1]]])
+        # the first and last color stops, with the interpolated values written
+        # directly between them
+        lut = np.empty((N, rgba.shape[1]))
+        lut[0], lut[-1] = rgba[0], rgba[-1]
+        np.multiply(frac_dist[:, np.newaxis], length, out=lut[1:-1])
+        lut[1:-1] += start
 
     # ensure that the lut is confined to values between 0 and 1 by clipping it
-    return np.clip(lut, 0.0, 1.0)  # type: ignore
+    # (in place: lut is always a new array by now)
+    np.clip(lut, 0.0, 1.0, out=lut)
+    return lut
+
+
+@lru_cache(maxsize=64)
+def _gamma_xind(N: int, gamma: float) -> np.ndarray:
+    """Return N evenly spaced values from 0 to 1, raised to `gamma` (cached).
+
+    With `gamma=1` this is a cached, read-only `np.linspace(0, 1, N)`.
+    """
+    xind = np.linspace(0, 1, N)
+    if gamma != 1:
+        xind **= gamma
+    xind.flags.writeable = False  # shared by all callers
+    return xind
+
+
+@lru_cache(maxsize=_LUT_CACHE_SIZE)
+def _interpolate_stops_cached(stops: bytes, N: int, gamma: float) -> np.ndarray:
+    """Cached `_interpolate_stops`, for an (R, 5) float64 stops array given as bytes.
+
+    The returned LUT is shared by all callers, so it is made read-only.
+    """
+    lut = _interpolate_stops(N, np.frombuffer(stops).reshape(-1, 5), gamma)
+    lut.flags.writeable = False
+    return lut
 
 
-def _map_rgb(mappers: Iterable[LutCallable], ary: NDArray) -> NDArray:
+def _map_rgb(mappers: Sequence[LutCallable], ary: NDArray) -> NDArray:
     """Combine multiple LutCallables into single rgb array."""
-    return np.stack([_g(np.asarray(ary)) for _g in mappers], axis=-1)
+    ary = np.asarray(ary)
+    # write each channel straight into the output, rather than stacking them
+    out = np.empty((*ary.shape, len(mappers)))
+    for i, _g in enumerate(mappers):
+        out[..., i] = _g(ary)
+    return out
 
 
 def _mpl_segmentdata_to_stops(
     data: MPLSegmentData, precision: int = 16, N: int = 256, gamma: float = 1.0
-) -> list[ColorStopLike] | LutCallable:
-    """Convert a matplotlib colormap segmentdata dict to a list of stops.
+) -> np.ndarray | LutCallable:
+    """Convert a matplotlib colormap segmentdata dict to a (K, 5) array of stops.
 
     Parameters
     ----------
@@ -1341,8 +1601,9 @@ def _mpl_segmentdata_to_stops(
 
     Returns
     -------
-    stops : list[tuple[float, RGBTuple]]
-        A list of (position, [r, g, b]) tuples.
+    stops : np.ndarray | LutCallable
+        A (K, 5) array of (position, r, g, b, a) stops, sorted by position (or a
+        callable LUT function, if the segmentdata values are callables).
     """
     if all(callable(v) for v in data.values()):
         funcs: tuple = (data["red"], data["green"], data["blue"])
@@ -1353,24 +1614,72 @@ def _mpl_segmentdata_to_stops(
         raise ValueError(
             "All values in segmentdata dict must be either callable or a sequence"
         )
-    keys = ("red", "green", "blue")
-    rgb_stops = [[i[:2] for i in data[c]] for c in keys]  # type: ignore
-    all_positions = np.array(sorted({i for n in rgb_stops for i, _ in n}))
-    rgb = [np.interp(all_positions, *np.asarray(s).T) for s in rgb_stops]
-    if "alpha" in data:
-        _a = [i[:2] for i in cast("Sequence", data["alpha"])]
-        alpha = np.interp(all_positions, *np.asarray(_a).T)
-    else:
-        alpha = np.ones_like(all_positions)
+    keys = [k for k in ("red", "green", "blue", "alpha") if k in data]
+    # (K, 3) arrays of (x, y0, y1) for each channel (only x and y0 are used)
+    segments = [np.asarray(data[k], dtype=float) for k in keys]
+    all_positions = np.unique(np.concatenate([s[:, 0] for s in segments]))
+
+    # sample every channel at the union of all positions (alpha defaults to 1)
+    stops = np.ones((len(all_positions), 5))
+    stops[:, 0] = all_positions
+    for i, s in enumerate(segments, start=1):
+        stops[:, i] = np.interp(all_positions, s[:, 0], s[:, 1])
+    return stops
 
-    rgba = np.stack([*rgb, alpha], axis=1)
-    return [(a, tuple(b)) for a, b in zip(all_positions, rgba.tolist())]
 
+_IDENTIFIER_TABLE = str.maketrans(" -:", "___")
+# same as _IDENTIFIER_TABLE, but also deletes all other non-alphanumeric ASCII chars
+_ASCII_IDENTIFIER_TABLE = str.maketrans(
+    " -:",
+    "___",
+    "".join(c for c in map(chr, range(128)) if not c.isalnum() and c not in "_ -:"),
+)
 
+
+@lru_cache(maxsize=1024)
 def _make_identifier(name: str) -> str:
     """Return a valid Python identifier from a string."""
+    if name.isascii():
+        return name.translate(_ASCII_IDENTIFIER_TABLE).lower()
     out = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ", ":"))
-    return out.lower().replace(" ", "_").replace("-", "_").replace(":", "_")
+    return out.lower().translate(_IDENTIFIER_TABLE)
+
+
+# parsed ColorStops of catalog colormaps, by (qualified name, reversed)
+_CATALOG_STOPS: dict[tuple[str, bool], ColorStops] = {}
+
+
+def _catalog_color_stops(info: CatalogItem, rev: bool = False) -> ColorStops:
+    """Return the ColorStops for a catalog item, optionally reversed.
+
+    Catalog data is only parsed once: later calls return a shallow copy of the
+    cached object (so the caller may still set its interpolation), which shares the
+    same read-only stops array.
+    """
+    key = (info.qualified_name, rev)
+    if (stops := _CATALOG_STOPS.get(key)) is None:
+        if rev:
+            stops = _catalog_color_stops(info).reversed()
+        elif isinstance(info.data, list):
+            ld = len(info.data[0])
+            if ld == 2:
+                # if it's a list of tuples, it's a list of color stops
+                stops = ColorStops._from_uniform_stops(info.data)
+            elif ld == 3:
+                stops = ColorStops._from_colorarray_like(info.data)
+            else:  # pragma: no cover
+                raise ValueError(
+                    f"Invalid catalog colormap data for {info.name!r}: {info.data}"
+                )
+        else:
+            stops = _parse_colorstops(info.data)
+            if stops is info.data:
+                # don't freeze the catalog item's own ColorStops
+                stops = copy(stops)
+                stops._stops = stops._stops.copy()
+        stops._stops.flags.writeable = False  # shared by all copies
+        _CATALOG_STOPS[key] = stops
+    return copy(stops)
 
 
 def _is_mpl_segmentdata(obj: Any) -> TypeGuard[MPLSegmentData]:
@@ -1411,6 +1720,11 @@ def _parse_colorstops(
     if isinstance(val, str):
         rev = val.endswith("_r")
         data = Colormap.catalog()[val[:-2] if rev else val]
+        if cls is ColorStops:
+            # parsed only once (and shared with Colormaps of the same name)
+            stops = _catalog_color_stops(data, rev)
+            stops._interpolation = _norm_interp(data.interpolation)
+            return stops
         stops = _parse_colorstops(data.data, cls=cls)
         stops._interpolation = _norm_interp(data.interpolation)
         return stops.reversed() if rev else stops
@@ -1423,7 +1737,9 @@ def _parse_colorstops(
         _mpl_stops = _mpl_segmentdata_to_stops(val)
         if callable(_mpl_stops):
             return cls(lut_func=_mpl_stops)
-        _clr_seq = _mpl_stops
+        # positions are already sorted and filled, the colors just need clipping
+        np.clip(_mpl_stops[:, 1:], 0, 1, out=_mpl_stops[:, 1:])
+        return cls(_mpl_stops)
     elif isinstance(val, dict):
         if not all(isinstance(x, Number) for x in val):
             raise ValueError(
@@ -1441,6 +1757,9 @@ def _parse_colorstops(
 
     _positions: list[float | None] = []
     _colors: list[Color] = []
+    # the last explicit position, to check that positions are in ascending order
+    last: float = -np.inf
+    descending = False
     for item in _clr_seq:
         if isinstance(item, (tuple, list)) and len(item) == 2:
             # a 2-tuple cannot be a valid color, so it must be a stop
@@ -1452,10 +1771,13 @@ def _parse_colorstops(
             _position, *item = cast("Sequence[float]", item)
         else:
             _position = None
+        if _position is not None:
+            descending = descending or _position < last
+            last = _position
         _positions.append(_position)
         _colors.append(Color(item))  # type: ignore  # this will raise if invalid
 
-    if (np.diff([x for x in _positions if x is not None]) < 0).any():
+    if descending:
         raise ValueError("Color stops must be in ascending position order")
 
     _stops = _fill_stops(_positions, "neighboring")  # TODO: expose fill_mode?
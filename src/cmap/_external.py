@@ -95,7 +95,7 @@ def to_bokeh(cm: Colormap, N: int = 256) -> BokehLinearColorMapper:
     from bokeh.models import LinearColorMapper
 
     # TODO: check whether bokeh has it's own interpolation, and if so, use that
-    return LinearColorMapper([color.hex for color in cm.iter_colors(N)])
+    return LinearColorMapper(_hex_colors(cm, N))
 
 
 def to_altair(cm: Colormap, N: int = 256) -> list[str]:
@@ -103,7 +103,18 @@ def to_altair(cm: Colormap, N: int = 256) -> list[str]:
 
     Suitable for passing to the range parameter of altair.Scale.
     """
-    return [color.hex for color in cm.iter_colors(N)]
+    return _hex_colors(cm, N)
+
+
+def _hex_colors(cm: Colormap, N: int) -> list[str]:
+    """Return hex strings for N colors sampled evenly from the colormap.
+
+    Equivalent to `[c.hex for c in cm.iter_colors(N)]`, but formatted straight
+    from the mapped RGBA array, without creating a `Color` object for every sample.
+    """
+    from ._color import _rgba_array_to_hex
+
+    return _rgba_array_to_hex(cm._sample_rgba(N))
 
 
 def to_pyqtgraph(cm: Colormap) -> PyqtgraphColorMap:
@@ -188,10 +199,11 @@ def rich_print_colormap(cm: Colormap, width: int | None = None) -> None:
 
     # TODO: this is a side-effect
     console = get_console()
-    color_cell = Text("")
     # if cm.interpolation == "nearest":
     # width = len(cm.color_stops)
     width = width or (console.width - 12)
-    for color in cm.iter_colors(width):
-        color_cell += Text(" ", style=Style(bgcolor=color.hex[:7]))
+    # assembled in one go, rather than concatenating a new Text for every cell
+    color_cell = Text.assemble(
+        *((" ", Style(bgcolor=hex_color[:7])) for hex_color in _hex_colors(cm, width))
+    )
     console.print(color_cell)
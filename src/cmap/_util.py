@@ -237,6 +237,84 @@ def hsv_to_rgb(hsv: ArrayLike) -> NDArray:
     return cast("NDArray", rgb.reshape(in_shape))
 
 
+def _as_rgb_array(rgb: ArrayLike) -> NDArray:
+    rgb = np.asarray(rgb)
+    # check length of the last dimension, should be _some_ sort of rgb
+    if rgb.shape[-1] != 3:
+        raise ValueError(
+            f"Last dimension of input array must be 3; shape {rgb.shape} was found."
+        )
+    # Don't work on ints.
+    return np.asarray(rgb, dtype=np.promote_types(rgb.dtype, np.float32))
+
+
+def _hue_array(rgb: NDArray, maxc: NDArray, delta: NDArray) -> NDArray:
+    """Return the hue (0-1) for an (..., 3) rgb array, given its max and range.
+
+    Vectorized version of `cmap._color._hue` (keep the two formulas in sync).
+    """
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h = np.where(
+            r == maxc,
+            (g - b) / delta,
+            np.where(g == maxc, 2.0 + (b - r) / delta, 4.0 + (r - g) / delta),
+        )
+    return np.where(delta == 0, 0.0, (h / 6.0) % 1.0)
+
+
+def rgb_to_hsv(rgb: ArrayLike) -> NDArray:
+    """Convert rgb values to hsv.
+
+    Vectorized equivalent of `cmap.RGBA.to_hsv` (and `colorsys.rgb_to_hsv`).
+
+    Parameters
+    ----------
+    rgb : (..., 3) array-like
+       All values assumed to be in range [0, 1]
+
+    Returns
+    -------
+    (..., 3) ndarray
+       Colors converted to HSV values in range [0, 1]
+    """
+    rgb = _as_rgb_array(rgb)
+    maxc = rgb.max(axis=-1)
+    delta = maxc - rgb.min(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s = np.where(delta == 0, 0, delta / maxc)
+    return np.stack([_hue_array(rgb, maxc, delta), s, maxc], axis=-1)
+
+
+def rgb_to_hsl(rgb: ArrayLike) -> NDArray:
+    """Convert rgb values to hsl.
+
+    Vectorized equivalent of `cmap.RGBA.to_hsl` (and `colorsys.rgb_to_hls`, but note
+    the order of the output: hue, saturation, lightness).
+
+    Parameters
+    ----------
+    rgb : (..., 3) array-like
+       All values assumed to be in range [0, 1]
+
+    Returns
+    -------
+    (..., 3) ndarray
+       Colors converted to HSL values in range [0, 1]
+    """
+    rgb = _as_rgb_array(rgb)
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    delta = maxc - minc
+    lightness = (maxc + minc) / 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s = np.where(
+            lightness <= 0.5, delta / (maxc + minc), delta / (2.0 - maxc - minc)
+        )
+    s = np.where(delta == 0, 0.0, s)
+    return np.stack([_hue_array(rgb, maxc, delta), s, lightness], axis=-1)
+
+
 def sineramp(
     shape: tuple[int, int] | int = (256, 512),
     amp: float = 0.05,
@@ -3,7 +3,7 @@ from typing import Any
 import numpy as np
 import pytest
 
-from cmap._color import RGBA, RGBA8, Color, parse_int
+from cmap._color import RGBA, RGBA8, Color, parse_int, parse_rgba_array
 
 try:
     import colour
@@ -48,6 +48,7 @@ except ImportError:
         ("rgb(100%,none, 0%)", (255, 0, 0)),
         ("rgba(2, 3, 4, 0.5)", (2, 3, 4, 0.5)),
         ("rgba(2,3,4,50%)", (2, 3, 4, 0.5)),
+        ("rgba(2, 3, 4, 150%)", (2, 3, 4, 1)),
         ("rgb(-2, 3, 4)", (0, 3, 4)),
         ("rgb(100, 200, 300)", (100, 200, 255)),
         ("rgb(20, 10, 0, -10)", (20, 10, 0, 0)),
@@ -107,6 +108,12 @@ def test_color_errors() -> None:
         Color("rgb(100%, 200%, 300%, 400%, 500%)")
     with pytest.raises(ValueError, match="Invalid color string"):
         Color("seven")
+    with pytest.raises(ValueError, match="Invalid color string"):
+        Color("hsl(red)")
+    with pytest.raises(ValueError, match="Invalid color string"):
+        Color("rgb(1, 2, 3)garbage")
+    with pytest.raises(ValueError, match="Invalid color string"):
+        Color("#ff_000")  # int(x, 16) would accept this
     with pytest.raises(TypeError, match="Cannot convert typ"):
         Color(1.2)  # type: ignore
     with pytest.raises(AttributeError, match="Color is immutable"):
@@ -123,6 +130,14 @@ def test_rgb_conversions() -> None:
     assert rgba.to_hex() == rgba.to_float().to_hex() == "#3B54E299"
     assert str(rgba) == str(rgba.to_float()) == "#3B54E299"
 
+    # out-of-range channels are clamped when formatting hex strings
+    assert RGBA8(300, 0, 0).to_hex() == "#FF0000"
+    assert RGBA8(-1, 0, 0).to_hex() == "#000000"
+    assert RGBA(-0.2, 0, 0, 1).to_hex() == "#000000"
+    assert RGBA(1, 0, 0, 1.5).to_hex() == "#FF0000FF"
+    assert Color("hsl(0, 150%, 50%)").hex == "#FF0000"
+    assert Color("hsl(0, 100%, 150%)").hex == "#FFFFFF"
+
 
 def test_color_conversions() -> None:
     color = Color("red")
@@ -199,3 +214,77 @@ def test_parse_int():
 @pytest.mark.parametrize("fmt", ["rgb", "rgba", "bgr"])
 def test_round_trip(input: int, fmt: str):
     assert Color.from_int(input, fmt).to_int(fmt) == input
+
+
+def test_cached_properties() -> None:
+    color = Color((0.1, 0.2, 0.3, 0.4))
+    assert color.hex is color.hex
+    assert color.hsl is color.hsl
+    assert color.hsv is color.hsv
+    assert color.rgba8 is color.rgba8
+    assert color.rgba_string is color.rgba_string
+    assert color.hex == color.rgba.to_hex()
+    assert color.rgba8 == color.rgba.to_8bit()
+    assert color.name is None
+    assert Color((1.0, 0.0, 0.0)).name == "red"
+
+
+def test_color_cache_is_weak() -> None:
+    import gc
+    from weakref import ref
+
+    color = Color((0.123, 0.456, 0.789))
+    assert Color((0.123, 0.456, 0.789)) is color  # reused while it is alive
+    color_ref = ref(color)
+    del color
+    gc.collect()
+    assert color_ref() is None  # ... but not kept alive by the cache
+
+    # named colors are always kept alive
+    red_ref = ref(Color("red"))
+    gc.collect()
+    assert red_ref() is not None
+    assert Color("red") is Color("Red") is Color((1.0, 0.0, 0.0))
+
+
+def test_third_party_parser_registered(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+    import types
+
+    from cmap import _color
+
+    class FakeColour:
+        def get_rgb(self) -> tuple:
+            return (1.0, 0.0, 0.0)
+
+    fake_module = types.ModuleType("colour")
+    fake_module.Color = FakeColour  # type: ignore
+    monkeypatch.setitem(sys.modules, "colour", fake_module)
+    # (isolate the type registration from the rest of the test session)
+    monkeypatch.setattr(_color, "_PARSERS", dict(_color._PARSERS))
+
+    assert Color(FakeColour()) is Color("red")
+    # once seen, the type is parsed directly, without looking up its module again
+    monkeypatch.delitem(sys.modules, "colour")
+    assert Color(FakeColour()) is Color("red")
+
+
+def test_parse_str_cached() -> None:
+    from cmap._color import _parse_str
+
+    Color("rgba(12, 34, 56, 0.7)")
+    hits = _parse_str.cache_info().hits
+    assert Color("rgba(12, 34, 56, 0.7)").rgba8 == (12, 34, 56, 0.7)
+    assert _parse_str.cache_info().hits == hits + 1
+
+
+def test_parse_rgba_array() -> None:
+    out = parse_rgba_array([[255, 0, 0], [0, 510, -1]])
+    np.testing.assert_array_equal(out, [[1, 0, 0, 1], [0, 1, 0, 1]])
+    out = parse_rgba_array(np.array([[1.0, 0.5, 0, 0.25], [2, 0, 0, 1]]))
+    np.testing.assert_array_equal(out, [[1, 0.5, 0, 0.25], [1, 0, 0, 1]])
+    # matches the scalar parser
+    for red in REDS[-6:-2]:
+        assert tuple(parse_rgba_array(red)[0]) == Color(red).rgba
+    with pytest.raises(ValueError, match="Expected an"):
+        parse_rgba_array(np.zeros((2, 5)))
@@ -66,11 +66,20 @@ def test_colormap() -> None:
         cmap([0, 0.5, 1.0], N=255), [(1, 0, 0, 1), (1, 0, 1, 1), (0, 0, 1, 1)]
     )
 
+    # scalars map exactly like arrays, and the input is never modified
+    x = np.array([-0.1, 0.0, 0.3, 1.0, 1.5, np.nan])
+    npt.assert_array_equal(cmap(x), [cmap(float(v)) for v in x])
+    npt.assert_array_equal(x, [-0.1, 0.0, 0.3, 1.0, 1.5, np.nan])
+    assert cmap(1, N=3) is cmap(np.int16(1), N=3) is Color("m")
+    for i in (-1, 0, 2, 3):
+        assert cmap(i, N=3) == Color(cmap(np.array([i]), N=3)[0])
+
 
 def test_colorstops() -> None:
     cmap = Colormap(["red", "magenta", "blue"])
     assert cmap.color_stops.stops == (0, 0.5, 1.0)
     assert cmap.color_stops != {"1234"}  # just check a random comparison
+    assert cmap.color_stops != ColorStops.parse(["r", "b"])  # different lengths
     for x, e in zip(cmap.color_stops.colors, "rmb"):
         assert isinstance(x, Color)
         assert x == e
@@ -88,6 +97,18 @@ def test_colorstops() -> None:
     )
 
     assert reversed(cmap.color_stops) == ColorStops.parse(["b", "m", "r"])
+    uneven = ColorStops.parse([(0.2, "r"), (0.6, "b")])
+    assert uneven.reversed().stops == (0.4, 0.8)
+    assert uneven.stops == (0.2, 0.6)  # the original is not modified
+
+    # LUTs and comparisons follow in-place edits of the stops
+    stops = ColorStops.parse(["r", "b"])
+    before = stops.to_lut(3)
+    assert stops == ColorStops.parse(["r", "b"])
+    np.asarray(stops)[1, 1:] = (0, 1, 0, 1)
+    assert stops != ColorStops.parse(["r", "b"])
+    npt.assert_allclose(stops.to_lut(3)[-1], (0, 1, 0, 1))
+    assert not np.array_equal(stops.to_lut(3), before)
 
 
 def test_colormap_copy() -> None:
@@ -105,6 +126,12 @@ def test_colormap_copy() -> None:
     assert cmap1 == pickle.loads(pickle.dumps(cmap1)) == cmap2  # noqa: S301
     assert cmap1 != {"1234"}
 
+    # equality allows for small differences (np.allclose), which no hash can honor
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(cmap1)
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(cmap1.color_stops)
+
 
 def test_colormap_errors() -> None:
     with pytest.raises(ValueError, match="Colormap 'bad_string' not found"):
@@ -123,6 +150,26 @@ def test_colormap_methods() -> None:
     assert list(cmap1.color_stops) == [(0, "r"), (0.5, "m"), (1, "b")]
     assert Colormap(reversed(cmap1.color_stops)) == Colormap(["b", "m", "r"])
     assert list(cmap1.iter_colors(3)) == [Color("r"), Color("m"), Color("b")]
+    assert cmap1.to_altair(3) == ["#FF0000", "#FF00FF", "#0000FF"]
+    cmap2 = Colormap(["r", (0.0, 0.0, 1.0, 0.5), "g"], interpolation="nearest")
+    assert cmap2.to_altair(7) == [c.hex for c in cmap2.iter_colors(7)]
+    assert cmap1.to_css(as_hex=True) == (
+        "background: #FF0000;\n"
+        "background: linear-gradient(90deg, #FF0000 0%, #FF00FF 50%, #0000FF 100%);\n"
+    )
+    assert cmap2.to_css(radial=True) == (
+        "background: rgb(255, 0, 0);\n"
+        "background: radial-gradient(rgb(255, 0, 0) 33.3333%, "
+        "rgba(0, 0, 255, 0.5) 33.3333%, rgba(0, 0, 255, 0.5) 66.6667%, "
+        "rgb(0, 255, 0) 66.6667%);\n"
+    )
+    # out-of-range stops are clamped, like Color does
+    wild = ColorStops(np.array([[0, 1.2, -0.1, 0, 1], [1, 0, 0, 1, 1.5]]))
+    assert wild.to_css() == (
+        "background: rgb(255, 0, 0);\n"
+        "background: linear-gradient(90deg, rgb(255, 0, 0) 0%, rgb(0, 0, 255) 100%);\n"
+    )
+    assert wild.to_css(as_hex=True).startswith("background: #FF0000;")
 
 
 def test_colormap_apply() -> None:
@@ -133,6 +180,22 @@ def test_colormap_apply() -> None:
     new_order = ">" if sys.byteorder == "little" else "<"
     swapped = img.view(img.dtype.newbyteorder(new_order))
     assert cmap1(swapped).shape == (10, 10, 4)
+    data = np.linspace(-0.5, 1.5, 20).reshape(4, 5)
+    for dtype in (data.dtype, np.int16):
+        native = data.astype(dtype)
+        npt.assert_array_equal(
+            cmap1(native.astype(native.dtype.newbyteorder(new_order))), cmap1(native)
+        )
+    # object arrays of floats are mapped like float arrays (not truncated to ints)
+    npt.assert_array_equal(cmap1(data.astype(object)), cmap1(data))
+
+    # results can be written into a preallocated array
+    out = np.empty((4, 5, 4))
+    assert cmap1(data, out=out) is out
+    npt.assert_array_equal(out, cmap1(data))
+    out8 = np.empty((4, 5, 4), dtype=np.uint8)
+    assert cmap1(data.astype(np.uint8), bytes=True, out=out8) is out8
+    npt.assert_array_equal(out8, cmap1(data.astype(np.uint8), bytes=True))
 
 
 def test_fill_stops() -> None:
@@ -142,6 +205,9 @@ def test_fill_stops() -> None:
     assert _fill_stops([None, None, 0.8, None], "fractional") == [0, 1 / 3, 0.8, 1.0]
     assert _fill_stops([None, None, 0.8], "neighboring") == [0, 0.4, 0.8]
     assert _fill_stops([None, None, 0.8], "fractional") == [0, 0.5, 0.8]
+    assert _fill_stops([None, 0.2, None, None, 0.5, None]) == pytest.approx(
+        [0, 0.2, 0.3, 0.4, 0.5, 1.0]
+    )
 
 
 def test_to_lut() -> None:
@@ -159,6 +225,97 @@ def test_to_lut() -> None:
     npt.assert_allclose(cmap.lut(3), [(1, 0, 0, 1), (0.5, 0, 0.5, 1), (0, 0, 1, 1)])
 
 
+def test_luts_are_writable_copies() -> None:
+    # identical stops share the interpolation, but every colormap (and every to_lut
+    # call) gets its own writable LUT
+    cmap = Colormap([(0.2, "r"), (0.8, "b")])
+    lut = Colormap([(0.2, "r"), (0.8, "b")]).lut(3)
+    assert lut is not cmap.lut(3)
+    assert lut.flags.writeable
+    assert cmap.color_stops.to_lut(3).flags.writeable
+    assert cmap.color_stops.to_lut(3) is not cmap.color_stops.to_lut(3)
+
+    # ... also for the (shared) stops of catalog colormaps
+    stops = Colormap("viridis").color_stops
+    assert stops.color_array.flags.writeable
+    assert np.asarray(stops).flags.writeable
+    np.asarray(stops)[:] = 0
+    assert Colormap("viridis").color_stops.color_array.any()
+
+
+def test_lut_bytes() -> None:
+    cmap = Colormap(["red", "blue"])
+    lut8 = cmap.lut(3, bytes=True)
+    assert lut8.dtype == np.uint8
+    npt.assert_array_equal(
+        lut8, [(255, 0, 0, 255), (127, 0, 127, 255), (0, 0, 255, 255)]
+    )
+    # uint8 luts are cached alongside the float luts
+    assert cmap.lut(3, bytes=True) is lut8
+    npt.assert_array_equal(cmap([0.0, 1.0], N=3, bytes=True), lut8[[0, 2]])
+
+
+def test_packed_lut() -> None:
+    # packed luts are a uint32 view of the uint8 lut
+    cmap = Colormap(["red", "blue"])
+    packed = cmap.packed_lut(3)
+    assert packed.dtype == np.uint32
+    assert packed.shape == (3,)
+    npt.assert_array_equal(packed.view(np.uint8).reshape(3, 4), cmap.lut(3, bytes=True))
+
+
+def test_call_with_unsigned_ints() -> None:
+    # unsigned ints that always fit in the LUT index it directly
+    cmap = Colormap(["red", "blue"])
+    img = np.array([[0, 2], [1, 255]], dtype=np.uint8)
+    npt.assert_array_equal(cmap(img, N=256), cmap.lut(256)[img])
+    npt.assert_array_equal(cmap(img, N=3), cmap(img.astype(int), N=3))
+    npt.assert_array_equal(cmap(img.astype(np.uint16)), cmap.lut(256)[img])
+
+
+def test_lookup() -> None:
+    cmap = Colormap(["red", "blue"])
+    img = np.array([[0, 2], [1, 255]], dtype=np.uint8)
+    npt.assert_array_equal(cmap.lookup(img), cmap.lut(256)[img])
+    npt.assert_array_equal(cmap.lookup(2, N=3, bytes=True), cmap.lut(3, bytes=True)[2])
+    with pytest.raises(IndexError):
+        cmap.lookup(3, N=3)
+    # negative indices are out of range too (rather than wrapping around)
+    with pytest.raises(IndexError):
+        cmap.lookup(-1, N=3)
+    with pytest.raises(IndexError):
+        cmap.lookup(np.array([0, -2]), N=3)
+
+
+def test_lut_cache_size() -> None:
+    cmap = Colormap(["red", "blue"])
+    try:
+        Colormap.set_lut_cache_size(2)
+        lut3, lut4 = cmap.lut(3), cmap.lut(4)
+        assert cmap.lut(3) is lut3  # now the most recently used
+        cmap.lut(5)  # evicts the least recently used LUT (N=4)
+        assert cmap.lut(3) is lut3
+        assert cmap.lut(4) is not lut4
+
+        # disabling the cache also stops returning LUTs that were already cached
+        lut7 = cmap.lut(7)
+        lut8 = cmap.lut(8)  # (the most recent call)
+        Colormap.set_lut_cache_size(0)
+        assert cmap.lut(8) is not lut8
+        assert cmap.lut(7) is not lut7
+        npt.assert_array_equal(cmap.lut(7), lut7)
+        assert cmap.lut(7) is not cmap.lut(7)
+    finally:
+        Colormap.set_lut_cache_size(128)
+    # re-enabling the cache starts over
+    assert cmap.lut(8) is not lut8
+    assert cmap.lut(7) is cmap.lut(7)
+    # the most recent LUT is remembered per call signature
+    assert cmap.lut(7, bytes=True).dtype == np.uint8
+    assert cmap.lut(7).dtype == np.float64
+    assert cmap.lut(7, with_over_under=True).shape == (10, 4)
+
+
 def test_mpl_segment_conversion() -> None:
     # just here to fill out coverage
     _cm = pytest.importorskip("matplotlib._cm")
@@ -166,7 +323,7 @@ def test_mpl_segment_conversion() -> None:
 
     for val in vars(_cm).values():
         if isinstance(val, dict) and "red" in val:
-            assert isinstance(_mpl_segmentdata_to_stops(val), (list, partial))
+            assert isinstance(_mpl_segmentdata_to_stops(val), (np.ndarray, partial))
 
 
 @pytest.fixture(params=(True, False))
@@ -192,6 +349,8 @@ def test_repr_notebook() -> None:
     cm = Colormap("viridis")
     assert "viridis" in cm._repr_html_()
     assert isinstance(cm._repr_png_(), bytes)
+    assert cm._repr_png_() is cm._repr_png_()  # the default image is cached
+    assert cm._repr_png_(width=10) != cm._repr_png_()
 
 
 def test_cmap_from_cmap() -> None:
@@ -207,6 +366,32 @@ def test_interp_arg_passed_to_stops() -> None:
     cm = Colormap(["#364B9A", "#4A7BB7", "#6EA6CD", "#98CAE1"])
     assert cm.color_stops._interpolation == "linear"
 
+    # catalog stops are parsed once and shared, but interpolation is not
+    cm1 = Colormap("viridis", interpolation="nearest")
+    cm2 = Colormap("viridis")
+    assert cm1.color_stops._stops is cm2.color_stops._stops
+    assert cm1.color_stops._interpolation == "nearest"
+    assert cm2.color_stops._interpolation == "linear"
+    assert Colormap("viridis_r").color_stops == cm2.color_stops.reversed()
+    # ColorStops.parse uses the same cache
+    assert ColorStops.parse("viridis")._stops is cm2.color_stops._stops
+    assert ColorStops.parse("viridis_r") == Colormap("viridis_r").color_stops
+
+
+def test_catalog_stops_not_frozen(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    from cmap import _colormap
+
+    monkeypatch.setattr(_colormap, "_CATALOG_STOPS", {})
+    # catalog data that is already a ColorStops object is copied before freezing
+    data = ColorStops(np.array(DATA))
+    info: Any = SimpleNamespace(qualified_name="test:stops", name="stops", data=data)
+    stops = _colormap._catalog_color_stops(info)
+    assert stops == data
+    assert not stops._stops.flags.writeable
+    assert data._stops.flags.writeable
+
 
 def test_with_extremes() -> None:
     cm = Colormap(["red", "blue"], under="green", over="yellow", bad="black")
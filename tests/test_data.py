@@ -131,6 +131,7 @@ def test_mpl_conversion() -> None:
     ]
 
     result = _mpl_segmentdata_to_stops(data)
-    for (rstop, rcolor), (estop, ecolor) in zip(result, expected):
-        assert rstop == estop
-        assert np.allclose(rcolor, ecolor)
+    assert result.shape == (len(expected), 5)
+    for row, (estop, ecolor) in zip(result, expected):
+        assert row[0] == estop
+        assert np.allclose(row[1:], ecolor)
@@ -55,6 +55,25 @@ def test_hsv_to_rgb() -> None:
         _util.hsv_to_rgb([0.5, 0.5, 0.5, 0.6])
 
 
+def test_rgb_to_hsv_hsl() -> None:
+    from cmap import Color
+
+    rgb = np.random.default_rng(0).random((20, 3))
+    rgb[:3] = [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5]]  # achromatic
+    hsv = _util.rgb_to_hsv(rgb)
+    hsl = _util.rgb_to_hsl(rgb)
+    assert hsv.shape == hsl.shape == (20, 3)
+    for i, c in enumerate(rgb):
+        np.testing.assert_allclose(hsv[i], Color(c).hsv[:3], atol=1e-12)
+        np.testing.assert_allclose(hsl[i], Color(c).hsl[:3], atol=1e-12)
+
+    np.testing.assert_allclose(_util.hsv_to_rgb(hsv), rgb, atol=1e-12)
+    np.testing.assert_allclose(_util.rgb_to_hsl([1, 0, 0]), [0, 1, 0.5])
+
+    with pytest.raises(ValueError):
+        _util.rgb_to_hsv([0.5, 0.5, 0.5, 0.6])
+
+
 def test_sineramp() -> None:
     ramp = _util.sineramp()
     assert isinstance(ramp, np.ndarray)